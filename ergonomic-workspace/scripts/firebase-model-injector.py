@@ -28,7 +28,12 @@ import os
 import re
 import sys
 import json
+import uuid
+import queue
 import argparse
+import functools
+import itertools
+import concurrent.futures
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
@@ -37,6 +42,7 @@ from datetime import datetime, timezone
 try:
     import firebase_admin
     from firebase_admin import credentials, firestore
+    from google.cloud import firestore as google_firestore
 except ImportError:
     print("ERROR: firebase-admin not installed. Run: pip install firebase-admin")
     sys.exit(1)
@@ -55,6 +61,32 @@ except ImportError:
     print("ERROR: python-dateutil not installed. Run: pip install python-dateutil")
     sys.exit(1)
 
+# Try to import orjson (optional - much faster JSON parsing, stdlib json works too)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Try to import ijson (optional - streaming parser for very large model files);
+# prefer the yajl2_c backend, ~3x faster than the pure-Python one. ijson 3.x
+# auto-selects the fastest installed backend, but older versions default to
+# pure Python, so ask for the C backend explicitly.
+try:
+    import ijson
+    from ijson.common import ObjectBuilder as IjsonObjectBuilder
+    try:
+        ijson = ijson.get_backend('yajl2_c')
+    except Exception:
+        pass
+except ImportError:
+    ijson = None
+
+# Try to import msgspec (optional - slotted C structs for parsed-data containers)
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 
 # ============================================
 # CONFIGURATION
@@ -63,39 +95,168 @@ except ImportError:
 # Pattern for model files: [1-9][0-9]*_model.json
 MODEL_FILE_PATTERN = re.compile(r'^[1-9]\d*_model\.json$')
 
+# Suffix used by the string-level fast path in _is_model_file_name
+MODEL_FILE_SUFFIX = '_model.json'
+
+# Directories never descended into during the model-file scan - node_modules
+# alone can hold tens of thousands of files in a Next.js tree
+PRUNE_DIRS = frozenset({
+    'node_modules', '.next', '.git', 'dist', 'build', '.venv', '__pycache__',
+})
+
 # Project root (script location)
 SCRIPT_DIR = Path(__file__).parent.absolute()
 PROJECT_ROOT = SCRIPT_DIR.parent
 
+# Slicing a path string at this offset yields the project-relative path for
+# log lines without the tokenize-and-walk cost of Path.relative_to
+PROJECT_ROOT_PREFIX_LEN = len(str(PROJECT_ROOT)) + 1
+
+# Firestore write concurrency: batch commits are blocking RPCs, so overlap
+# them with threads
+MAX_WRITE_WORKERS = 25
+
+# Cap on queued batch commits: each one retains a full 500-doc WriteBatch,
+# so without a bound all outstanding data accumulates in memory whenever
+# batch building outpaces the commit workers (defeating the streaming
+# path's bounded-memory guarantee on large files)
+MAX_PENDING_COMMITS = MAX_WRITE_WORKERS * 2
+
+# Parse concurrency: file I/O blocks and orjson releases the GIL while
+# decoding, so a few threads keep parsing ahead of the Firestore push
+MAX_PARSE_WORKERS = 4
+
+# Number of Firestore clients (gRPC channels) to spread writes across
+FIRESTORE_POOL_SIZE = 4
+
+# Bound on the scan -> parse and parse -> push queues; keeps memory
+# proportional to the queue sizes rather than the number of model files
+PIPELINE_QUEUE_SIZE = 64
+
+# Firestore hard limit on operations per WriteBatch
+FIRESTORE_BATCH_LIMIT = 500
+
+# Fields whose ISO date strings are converted to datetimes before writing
+DATE_FIELDS = frozenset({
+    'createdAt', 'updatedAt', 'conductedDate',
+    'scheduledDate', 'deliveryDate', 'completionDate',
+})
+
+# Value written to the _source metadata field on every injected document
+INJECTION_SOURCE = 'firebase-model-injector.py'
+
+# Model files at or above this size are stream-parsed with ijson (when
+# installed) so peak memory stays bounded by one item + metadata
+STREAM_THRESHOLD_BYTES = 16 * 1024 * 1024
+
+# Map common array field names to collection names
+COLLECTION_MAP = {
+    'clients': 'clients',
+    'assessments': 'assessments',
+    'questionnaires': 'questionnaireTemplates',
+    'installations': 'installations',
+    'layouts': 'layouts',
+    'recentClients': 'clients',  # Dashboard recentClients goes to clients collection
+}
+COLLECTION_VALUES = frozenset(COLLECTION_MAP.values())
+
 
 # ============================================
 # TYPE DEFINITIONS
 # ============================================
 
-class ParsedModelData:
-    """Container for parsed model file data"""
-    def __init__(self):
-        self.data: Dict[str, Any] = {}
-        self.collection_name: str = ""
-        self.document_id: str = "main"
-        self.nested_collections: Dict[str, Any] = {}
-        self.shared_data: Dict[str, Dict[str, Any]] = {}  # entity -> {collection, fields, data}
+if msgspec is not None:
+    # msgspec structs are slotted C structs - much smaller per instance and
+    # faster to create than a dict-backed class. gc=False is safe because
+    # parsed model data never forms reference cycles.
+    class ParsedModelData(msgspec.Struct, gc=False):
+        """Container for parsed model file data"""
+        data: Dict[str, Any] = {}
+        collection_name: str = ""
+        document_id: str = "main"
+        nested_collections: Dict[str, Any] = {}
+        shared_data: Dict[str, Dict[str, Any]] = {}  # entity -> {collection, fields, data}
+        stream_path: Optional[Path] = None  # set when arrays are streamed via ijson
+        stream_fields: List[str] = []  # top-level array fields left on disk
+else:
+    class ParsedModelData:
+        """Container for parsed model file data"""
+        def __init__(self):
+            self.data: Dict[str, Any] = {}
+            self.collection_name: str = ""
+            self.document_id: str = "main"
+            self.nested_collections: Dict[str, Any] = {}
+            self.shared_data: Dict[str, Dict[str, Any]] = {}  # entity -> {collection, fields, data}
+            self.stream_path: Optional[Path] = None  # set when arrays are streamed via ijson
+            self.stream_fields: List[str] = []  # top-level array fields left on disk
+
+
+class FirestoreClientPool:
+    """Round-robin pool of Firestore clients.
+
+    A single client multiplexes all RPCs over one gRPC channel, which
+    serializes on its HTTP/2 streams under heavy write concurrency.
+    Spreading batch commits across a few clients/channels sustains higher
+    write QPS and lowers tail latency.
+    """
+    def __init__(self, clients: List[firestore.Client]):
+        self._clients = clients
+        self._counter = itertools.count()  # itertools.count is thread-safe
+
+    def get(self) -> firestore.Client:
+        """Return the next client in round-robin order"""
+        return self._clients[next(self._counter) % len(self._clients)]
 
 
 # ============================================
 # MODEL FILE PARSER (SUPER SIMPLE!)
 # ============================================
 
-def find_model_files(app_dir: Path) -> List[Path]:
-    """Find all *_model.json files in the app directory"""
-    model_files = []
-    
-    for file_path in app_dir.rglob("*_model.json"):
-        if MODEL_FILE_PATTERN.match(file_path.name):
-            model_files.append(file_path)
-            print(f"  Found: {file_path.relative_to(PROJECT_ROOT)}")
-    
-    return model_files
+def _is_model_file_name(name: str) -> bool:
+    """String-level equivalent of MODEL_FILE_PATTERN for the scan hot path.
+
+    Plain prefix/suffix/isdigit checks avoid invoking the regex engine for
+    every file encountered; MODEL_FILE_PATTERN remains the reference
+    definition of the naming rule.
+    """
+    return (
+        name.endswith(MODEL_FILE_SUFFIX)
+        and name[0] in '123456789'
+        and name[:-len(MODEL_FILE_SUFFIX)].isdigit()
+    )
+
+
+def _scan_model_files(dir_path: str):
+    """Recursively yield model file paths (as strings) using os.scandir.
+
+    scandir's DirEntry caches stat info from the directory read, so this
+    avoids the extra stat() syscall and Path object construction per entry
+    that pathlib's rglob incurs.
+    """
+    try:
+        it = os.scandir(dir_path)
+    except OSError:
+        # Unreadable or concurrently-removed directory - skip it, matching
+        # the tolerance rglob had before the scandir rewrite
+        return
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in PRUNE_DIRS:
+                    yield from _scan_model_files(entry.path)
+            elif _is_model_file_name(entry.name) and entry.is_file(follow_symlinks=False):
+                yield entry.path
+
+
+def find_model_files(app_dir: Path):
+    """Yield *_model.json files in the app directory as they are found.
+
+    Streaming (rather than collecting a list) lets the caller start parsing
+    and pushing the first file before the scan of the whole tree completes.
+    """
+    for path_str in _scan_model_files(str(app_dir)):
+        print(f"  Found: {path_str[PROJECT_ROOT_PREFIX_LEN:]}")
+        yield Path(path_str)
 
 
 def extract_collection_name_from_path(model_path: Path, app_dir: Path) -> str:
@@ -119,13 +280,79 @@ def parse_json_model(file_path: Path) -> Dict[str, Any]:
     """
     Parse JSON model file - dead simple!
     """
+    if orjson is not None:
+        # orjson takes bytes and decodes UTF-8 internally (2-5x faster)
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
     with open(file_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
+def _stream_scan_model(file_path: Path):
+    """First streaming pass over a large model file with ijson.
+
+    Collects _metadata and small top-level values into a dict while only
+    recording the NAMES of top-level arrays of objects - their items stay
+    on disk and are re-streamed at push time, so peak memory is bounded by
+    one item + metadata regardless of file size.
+
+    Returns (data, stream_fields).
+    """
+    data: Dict[str, Any] = {}
+    stream_fields: List[str] = []
+
+    with open(file_path, 'rb') as f:
+        events = ijson.parse(f, use_float=True)
+        for prefix, event, value in events:
+            if prefix != '' or event != 'map_key':
+                continue
+            key = value
+            _, event, value = next(events)
+
+            if event == 'start_array':
+                # Peek at the first element: arrays of objects are streamed
+                # later, small scalar lists are kept in memory
+                prefix, event, value = next(events)
+                if event == 'start_map':
+                    stream_fields.append(key)
+                    for prefix, event, value in events:
+                        if prefix == key and event == 'end_array':
+                            break
+                else:
+                    builder = IjsonObjectBuilder()
+                    builder.event('start_array', None)
+                    if not (prefix == key and event == 'end_array'):
+                        builder.event(event, value)
+                        for prefix, event, value in events:
+                            builder.event(event, value)
+                            if prefix == key and event == 'end_array':
+                                break
+                    else:
+                        builder.event('end_array', None)
+                    data[key] = builder.value
+            elif event == 'start_map':
+                builder = IjsonObjectBuilder()
+                builder.event(event, value)
+                for prefix, event, value in events:
+                    builder.event(event, value)
+                    if prefix == key and event == 'end_map':
+                        break
+                data[key] = builder.value
+            else:
+                data[key] = value
+
+    return data, stream_fields
+
+
+def _iter_stream_items(file_path: Path, array_field: str):
+    """Yield items of a top-level array field one dict at a time via ijson"""
+    with open(file_path, 'rb') as f:
+        yield from ijson.items(f, f'{array_field}.item', use_float=True)
+
+
 def parse_model_file(model_path: Path, app_dir: Path) -> Optional[ParsedModelData]:
     """Parse a model file and extract data for Firebase"""
-    print(f"\n  Processing: {model_path.relative_to(PROJECT_ROOT)}")
+    print(f"\n  Processing: {str(model_path)[PROJECT_ROOT_PREFIX_LEN:]}")
     
     result = ParsedModelData()
     
@@ -134,8 +361,13 @@ def parse_model_file(model_path: Path, app_dir: Path) -> Optional[ParsedModelDat
     
     # Parse JSON
     try:
-        data = parse_json_model(model_path)
-        
+        # Stream very large files so giant arrays never materialize in memory
+        if ijson is not None and os.path.getsize(model_path) >= STREAM_THRESHOLD_BYTES:
+            data, result.stream_fields = _stream_scan_model(model_path)
+            result.stream_path = model_path
+        else:
+            data = parse_json_model(model_path)
+
         # Check for _metadata in the JSON
         if '_metadata' in data:
             meta = data['_metadata']
@@ -191,9 +423,11 @@ def parse_model_file(model_path: Path, app_dir: Path) -> Optional[ParsedModelDat
         
         print(f"    Collection: {result.collection_name}")
         print(f"    Document: {result.document_id}")
-        print(f"    Fields found: {len(result.data)}")
+        print(f"    Fields found: {len(result.data) + len(result.stream_fields)}")
         for key in result.data.keys():
             print(f"      - {key}")
+        for key in result.stream_fields:
+            print(f"      - {key} (streamed)")
         
         return result
         
@@ -209,6 +443,38 @@ def parse_model_file(model_path: Path, app_dir: Path) -> Optional[ParsedModelDat
 # FIREBASE OPERATIONS
 # ============================================
 
+@functools.lru_cache(maxsize=4096)
+def _parse_dt(value: str) -> datetime:
+    """Parse a date string, fast-pathing strict ISO-8601.
+
+    datetime.fromisoformat handles the common case far faster than
+    dateutil's format-guessing parser, which stays as the fallback. Cached
+    because many items share timestamps (e.g. bulk-migrated createdAt).
+    """
+    try:
+        dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        dt = date_parser.parse(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def _coerce_date(key: str, value: Any) -> Any:
+    """Convert ISO date strings in known date fields to aware datetimes.
+
+    Firestore stores naive values as-is, so returned datetimes are always
+    timezone-aware (UTC assumed when the string has no offset).
+    """
+    if key in DATE_FIELDS and isinstance(value, str):
+        try:
+            # Firestore Python SDK accepts datetime objects directly
+            return _parse_dt(value)
+        except Exception as e:
+            print(f"      Warning: Could not parse date {key}: {e}")
+    return value
+
+
 def get_firebase_uuid(required: bool = True) -> str:
     """Get Firebase UUID from environment"""
     firebase_uuid = os.getenv('FIREBASE_UUID')
@@ -224,12 +490,29 @@ def get_firebase_uuid(required: bool = True) -> str:
     return firebase_uuid
 
 
-def init_firebase(project_id: str, dry_run: bool = False) -> firestore.Client:
+def _make_client_pool(app, project_id: str) -> FirestoreClientPool:
+    """Build a pool of Firestore clients sharing the app's credentials.
+
+    firebase_admin caches one client per app, so extra clients (each with
+    its own gRPC channel) are created via google-cloud-firestore directly.
+    Falls back to a single shared client if that fails.
+    """
+    clients = [firestore.client(app)]
+    try:
+        credential = app.credential.get_credential()
+        for _ in range(FIRESTORE_POOL_SIZE - 1):
+            clients.append(google_firestore.Client(project=project_id, credentials=credential))
+    except Exception as e:
+        print(f"  Warning: Firestore client pool unavailable, using one channel: {e}")
+    return FirestoreClientPool(clients)
+
+
+def init_firebase(project_id: str, dry_run: bool = False) -> FirestoreClientPool:
     """Initialize Firebase Admin SDK with service account credentials"""
     # Check if already initialized
     try:
         app = firebase_admin.get_app()
-        return firestore.client(app)
+        return _make_client_pool(app, project_id)
     except ValueError:
         pass
     
@@ -268,22 +551,32 @@ def init_firebase(project_id: str, dry_run: bool = False) -> firestore.Client:
             if auth_override:
                 print(f"  Auth override UID: {firebase_uuid}")
         
-        return firestore.client()
+        return _make_client_pool(firebase_admin.get_app(), project_id)
     except Exception as e:
         print(f"ERROR: Failed to initialize Firebase: {e}")
         sys.exit(1)
 
 
 def push_shared_data_to_firestore(
-    db: firestore.Client,
+    pool: FirestoreClientPool,
     domain_id: str,
     shared_data: Dict[str, Dict[str, Any]],
     dry_run: bool = False
 ) -> bool:
     """Push shared data to _shared collections"""
+    db = pool.get()
     collection_path = f"project-{domain_id}"
+
+    # Injection metadata is identical for every entity in this push
     firebase_uuid = os.getenv('FIREBASE_UUID', 'unknown')
-    
+    injected_at = datetime.now(timezone.utc).isoformat()
+
+    # All shared-data sets are enqueued on one WriteBatch and committed
+    # together - Firestore allows mixed-collection batches up to 500 ops,
+    # so the whole shared-data push is normally a single RPC
+    batch = db.batch()
+    batch_ops = 0
+
     for entity_name, entity_info in shared_data.items():
         shared_collection = entity_info['collection']
         shared_data_obj = entity_info['data']
@@ -310,122 +603,164 @@ def push_shared_data_to_firestore(
             print(f"    [DRY RUN] Would write {len(shared_data_obj)} fields to shared collection")
             continue
         
+        # Add injection metadata
+        data_to_push = {
+            **shared_data_obj,
+            '_injectedAt': injected_at,
+            '_injectedBy': firebase_uuid,
+            '_source': INJECTION_SOURCE,
+        }
+
+        # Enqueue (merge to preserve existing data)
+        batch.set(doc_ref, data_to_push, merge=True)
+        batch_ops += 1
+        print(f"    [OK] Queued shared data: {entity_name}")
+
+        if batch_ops == FIRESTORE_BATCH_LIMIT:
+            try:
+                batch.commit()
+            except Exception as e:
+                print(f"    [ERROR] Failed to push shared data: {e}")
+                return False
+            batch = db.batch()
+            batch_ops = 0
+
+    if batch_ops:
         try:
-            # Add injection metadata
-            data_to_push = {
-                **shared_data_obj,
-                '_injectedAt': datetime.now(timezone.utc).isoformat(),
-                '_injectedBy': firebase_uuid,
-                '_source': 'firebase-model-injector.py',
-            }
-            
-            # Push to Firestore (merge to preserve existing data)
-            doc_ref.set(data_to_push, merge=True)
-            print(f"    [OK] Successfully pushed shared data: {entity_name}")
+            batch.commit()
+            print(f"    [OK] Successfully pushed shared data ({len(shared_data)} entity/entities)")
         except Exception as e:
-            print(f"    [ERROR] Failed to push shared data {entity_name}: {e}")
+            print(f"    [ERROR] Failed to push shared data: {e}")
             return False
-    
+
     return True
 
 
 def push_to_firestore(
-    db: firestore.Client,
+    pool: FirestoreClientPool,
     domain_id: str,
     model_data: ParsedModelData,
     dry_run: bool = False
 ) -> bool:
     """Push parsed model data to Firestore"""
-    
+    db = pool.get()
+
     # First, push shared data (if any) - this ensures shared collections exist before page collections reference them
     if model_data.shared_data:
         print(f"    Processing {len(model_data.shared_data)} shared data entity/entities...")
-        if not push_shared_data_to_firestore(db, domain_id, model_data.shared_data, dry_run):
+        if not push_shared_data_to_firestore(pool, domain_id, model_data.shared_data, dry_run):
             return False
     
-    # Get Firebase UUID for metadata
+    # Injection metadata is identical for every document in this push
     firebase_uuid = os.getenv('FIREBASE_UUID', 'unknown')
+    injected_at = datetime.now(timezone.utc).isoformat()
     
-    # Check if data contains arrays that should be written as individual documents
-    # Look for common array field names (clients, assessments, questionnaires, etc.)
-    array_fields = []
+    # Check if data contains arrays that should be written as individual
+    # documents (clients, assessments, questionnaires, etc.). One pass with
+    # exact type checks - model data is plain JSON so subclasses can't occur
+    # - and the items are kept alongside the key to avoid re-indexing later.
+    array_items = []  # (field, items) pairs for arrays of objects
     single_object_fields = []
-    
+
     for key, value in model_data.data.items():
-        if isinstance(value, list) and len(value) > 0 and isinstance(value[0], dict):
-            # This is an array of objects - write as individual documents
-            array_fields.append(key)
-        elif isinstance(value, dict):
+        if type(value) is list:
+            if value and type(value[0]) is dict:
+                # This is an array of objects - write as individual documents
+                array_items.append((key, value))
+        elif type(value) is dict:
             # This is a single object - might be written as a single document
             single_object_fields.append(key)
-    
-    # If we have array fields, write them to top-level collections
-    if array_fields:
-        for array_field in array_fields:
-            items = model_data.data[array_field]
-            
-            # Map common field names to collection names
-            collection_map = {
-                'clients': 'clients',
-                'assessments': 'assessments',
-                'questionnaires': 'questionnaireTemplates',
-                'installations': 'installations',
-                'layouts': 'layouts',
-                'recentClients': 'clients',  # Dashboard recentClients goes to clients collection
-            }
-            
+
+    # If we have array fields, write them to top-level collections.
+    # Streamed fields (large files parsed via ijson) are read lazily from
+    # disk so only one item at a time is in memory.
+    if array_items or model_data.stream_fields:
+        for array_field, field_items in array_items + [(f, None) for f in model_data.stream_fields]:
+            if field_items is None:
+                items = _iter_stream_items(model_data.stream_path, array_field)
+                item_count = None
+            else:
+                items = field_items
+                item_count = len(items)
+
             # Use mapped collection name or derive from field name
-            collection_name = collection_map.get(array_field, array_field.rstrip('s') if array_field.endswith('s') else array_field)
-            
+            collection_name = COLLECTION_MAP.get(array_field) or (
+                array_field.rstrip('s') if array_field.endswith('s') else array_field
+            )
+
             # Override with metadata collection name if it's explicitly set and different
             # (e.g., if metadata says "clients" but field is "recentClients", use "clients")
-            if model_data.collection_name and model_data.collection_name in collection_map.values():
+            if model_data.collection_name and model_data.collection_name in COLLECTION_VALUES:
                 collection_name = model_data.collection_name
             
             collection_ref = db.collection(collection_name)
             doc_path_base = f"{collection_name}"
             
-            print(f"    Writing {len(items)} items to collection: {collection_name}")
-            
+            if item_count is not None:
+                print(f"    Writing {item_count} items to collection: {collection_name}")
+            else:
+                print(f"    Streaming '{array_field}' items to collection: {collection_name}")
+
             if dry_run:
-                print(f"    [DRY RUN] Would write {len(items)} documents to {collection_name} collection")
+                if item_count is not None:
+                    print(f"    [DRY RUN] Would write {item_count} documents to {collection_name} collection")
+                else:
+                    print(f"    [DRY RUN] Would stream '{array_field}' documents to {collection_name} collection")
                 continue
             
+            def build_item_doc(item: Dict[str, Any]):
+                """Build (doc_ref, data) for one array item"""
+                # Use the 'id' field as document ID, or generate one locally.
+                # Firestore accepts any ID and the SDK's auto-ID is a
+                # client-side random string too, so this skips allocating a
+                # throwaway DocumentReference per item.
+                item_id = item.get('id') or uuid.uuid4().hex
+
+                # Build the final dict in one pass: drop 'id' (it becomes the
+                # document ID), convert date strings, then attach metadata
+                item_data = {k: _coerce_date(k, v) for k, v in item.items() if k != 'id'}
+                item_data['_injectedAt'] = injected_at
+                item_data['_injectedBy'] = firebase_uuid
+                item_data['_source'] = INJECTION_SOURCE
+
+                return collection_ref.document(str(item_id)), item_data
+
             try:
-                for item in items:
-                    if isinstance(item, dict):
-                        # Use the 'id' field as document ID, or generate one
-                        item_id = item.get('id')
-                        if not item_id:
-                            item_id = collection_ref.document().id
-                        
-                        # Convert date strings to Firestore Timestamps
-                        item_data = item.copy()
-                        for date_field in ['createdAt', 'updatedAt', 'conductedDate', 'scheduledDate', 'deliveryDate', 'completionDate']:
-                            if date_field in item_data and isinstance(item_data[date_field], str):
-                                try:
-                                    # Parse ISO 8601 date string
-                                    dt = date_parser.parse(item_data[date_field])
-                                    if dt.tzinfo is None:
-                                        dt = dt.replace(tzinfo=timezone.utc)
-                                    # Firestore Python SDK accepts datetime objects directly
-                                    item_data[date_field] = dt
-                                except Exception as e:
-                                    print(f"      Warning: Could not parse date {date_field}: {e}")
-                                    pass
-                        
-                        # Add injection metadata
-                        item_data['_injectedAt'] = datetime.now(timezone.utc).isoformat()
-                        item_data['_injectedBy'] = firebase_uuid
-                        item_data['_source'] = 'firebase-model-injector.py'
-                        
-                        # Remove 'id' from data (it's the document ID)
-                        if 'id' in item_data:
-                            del item_data['id']
-                        
-                        collection_ref.document(str(item_id)).set(item_data)
-                
-                print(f"    [OK] Successfully pushed {len(items)} documents to {collection_name} collection")
+                # Pack writes into WriteBatches of 500 (one RPC per batch
+                # instead of one per document) and commit each batch on the
+                # thread pool so batch building overlaps with the network.
+                written = 0
+                with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WRITE_WORKERS) as executor:
+                    pending = set()
+                    # Each batch commits on its own client so concurrent
+                    # commits spread across the pool's gRPC channels
+                    batch = pool.get().batch()
+                    batch_ops = 0
+                    for item in items:
+                        if not isinstance(item, dict):
+                            continue
+                        doc_ref, item_data = build_item_doc(item)
+                        batch.set(doc_ref, item_data)
+                        batch_ops += 1
+                        written += 1
+                        if batch_ops == FIRESTORE_BATCH_LIMIT:
+                            pending.add(executor.submit(batch.commit))
+                            if len(pending) >= MAX_PENDING_COMMITS:
+                                # Backpressure: wait for a commit to finish
+                                # before building the next batch
+                                completed, pending = concurrent.futures.wait(
+                                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                                )
+                                for future in completed:
+                                    future.result()  # surface commit errors
+                            batch = pool.get().batch()
+                            batch_ops = 0
+                    if batch_ops:
+                        pending.add(executor.submit(batch.commit))
+                    for future in concurrent.futures.as_completed(pending):
+                        future.result()  # surface commit errors
+
+                print(f"    [OK] Successfully pushed {written} documents to {collection_name} collection")
             except Exception as e:
                 print(f"    [ERROR] Failed to push {array_field} to {collection_name}: {e}")
                 return False
@@ -456,19 +791,16 @@ def push_to_firestore(
             for key, value in data_to_push.items():
                 if isinstance(value, str) and key in ['createdAt', 'updatedAt', 'conductedDate', 'scheduledDate']:
                     try:
-                        dt = date_parser.parse(value)
-                        if dt.tzinfo is None:
-                            dt = dt.replace(tzinfo=timezone.utc)
                         # Firestore Python SDK accepts datetime objects directly
-                        data_to_push[key] = dt
+                        data_to_push[key] = _parse_dt(value)
                     except Exception as e:
                         print(f"      Warning: Could not parse date {key}: {e}")
                         pass
             
             # Add injection metadata
-            data_to_push['_injectedAt'] = datetime.now(timezone.utc).isoformat()
+            data_to_push['_injectedAt'] = injected_at
             data_to_push['_injectedBy'] = firebase_uuid
-            data_to_push['_source'] = 'firebase-model-injector.py'
+            data_to_push['_source'] = INJECTION_SOURCE
             
             doc_ref.set(data_to_push)
             print(f"    [OK] Successfully pushed to Firestore")
@@ -495,9 +827,9 @@ def push_to_firestore(
         
         data_to_push = {
             **model_data.data,
-            '_injectedAt': datetime.now(timezone.utc).isoformat(),
+            '_injectedAt': injected_at,
             '_injectedBy': firebase_uuid,
-            '_source': 'firebase-model-injector.py',
+            '_source': INJECTION_SOURCE,
         }
         
         doc_ref.set(data_to_push)
@@ -563,7 +895,7 @@ def main():
     
     # Initialize Firebase
     print("\n[1/3] Initializing Firebase...")
-    db = init_firebase(project_id, args.dry_run)
+    db_pool = init_firebase(project_id, args.dry_run)
     
     # Find model files
     print("\n[2/3] Scanning for model files...")
@@ -572,36 +904,80 @@ def main():
         print(f"ERROR: App directory not found: {app_dir}")
         sys.exit(1)
     
-    model_files = find_model_files(app_dir)
-    
-    if not model_files:
-        print("\nNo model files found matching pattern: [1-9]*_model.json")
-        print("Make sure model files exist in the app directory.")
-        sys.exit(0)
-    
-    print(f"\nFound {len(model_files)} model file(s)")
-    
-    # Process and push each model file
+    # Process and push each model file as the scan finds it (streaming)
     print("\n[3/3] Processing and pushing model files...")
     success_count = 0
     error_count = 0
-    
-    for model_path in model_files:
-        parsed = parse_model_file(model_path, app_dir)
-        
+    file_count = 0
+
+    def push_parsed(parsed: Optional[ParsedModelData]) -> None:
+        nonlocal success_count, error_count
         if parsed:
-            if push_to_firestore(db, args.domain_id, parsed, args.dry_run):
+            if push_to_firestore(db_pool, args.domain_id, parsed, args.dry_run):
                 success_count += 1
             else:
                 error_count += 1
         else:
             error_count += 1
-    
+
+    # Producer/consumer pipeline: a scanner thread feeds paths into a
+    # bounded queue, parse workers turn them into ParsedModelData on a
+    # second bounded queue, and this thread drains that into Firestore.
+    # Scan, parse and push overlap, so wall-clock approaches the slowest
+    # stage instead of their sum, with memory bounded by the queue sizes.
+    path_queue: queue.Queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    parsed_queue: queue.Queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    done = object()  # end-of-stream sentinel
+
+    def scan_worker():
+        # Sentinels go out even if the scan raises, otherwise the parse
+        # workers (and with them the main thread and executor shutdown)
+        # would block forever and the error would never surface
+        try:
+            for model_path in find_model_files(app_dir):
+                path_queue.put(model_path)
+        finally:
+            for _ in range(MAX_PARSE_WORKERS):
+                path_queue.put(done)
+
+    def parse_worker():
+        # Same reasoning: the main thread counts one sentinel per worker,
+        # so post it even when a parse raises
+        try:
+            while True:
+                model_path = path_queue.get()
+                if model_path is done:
+                    return
+                parsed_queue.put(parse_model_file(model_path, app_dir))
+        finally:
+            parsed_queue.put(done)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_PARSE_WORKERS + 1) as executor:
+        workers = [executor.submit(scan_worker)]
+        workers += [executor.submit(parse_worker) for _ in range(MAX_PARSE_WORKERS)]
+
+        finished_workers = 0
+        while finished_workers < MAX_PARSE_WORKERS:
+            parsed = parsed_queue.get()
+            if parsed is done:
+                finished_workers += 1
+                continue
+            file_count += 1
+            push_parsed(parsed)
+
+        for future in workers:
+            future.result()  # surface scanner/parser errors
+
+    if file_count == 0:
+        print("\nNo model files found matching pattern: [1-9]*_model.json")
+        print("Make sure model files exist in the app directory.")
+        sys.exit(0)
+
     # Summary
     print("\n" + "=" * 60)
     print("SUMMARY")
     print("=" * 60)
-    print(f"Total files processed: {len(model_files)}")
+    print(f"Total files processed: {file_count}")
     print(f"Successful: {success_count}")
     print(f"Errors: {error_count}")
     